@@ -1,10 +1,20 @@
 import pydantic
 import copy
 import yaml
-from .utils import update_dict_deep
+from .utils import (
+    update_dict_deep,
+    iter_subclasses,
+    get_subclass_index,
+    clear_subclass_index,
+)
 
 
 class ObjCOD3S(pydantic.BaseModel):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # New subclasses must show up in from_dict
+        clear_subclass_index()
+
     @classmethod
     def get_subclasses(cls, recursive=True):
         """Enumerates all subclasses of a given class.
@@ -16,11 +26,9 @@ class ObjCOD3S(pydantic.BaseModel):
         # Return value
         A list of subclasses of `cls`.
         """
-        sub = cls.__subclasses__()
         if recursive:
-            for cls in sub:
-                sub.extend(cls.get_subclasses(recursive))
-        return sub
+            return list(iter_subclasses(cls))
+        return cls.__subclasses__()
 
     @classmethod
     def from_yaml(
@@ -72,8 +80,7 @@ class ObjCOD3S(pydantic.BaseModel):
                 obj[key] = basecls.from_dict(value)
 
             if "cls" in obj:
-                cls_sub_dict = {cls.__name__: cls for cls in ObjCOD3S.get_subclasses()}
-                cls_sub_dict[basecls.__name__] = basecls
+                cls_sub_dict = get_subclass_index(basecls, root=ObjCOD3S)
 
                 clsname = obj.pop("cls")
                 cls = cls_sub_dict.get(clsname)
@@ -1,8 +1,22 @@
 import pydantic
 import typing
+import dataclasses
+import sys
 import Pycatshoo as pyc
 from ..core import ObjCOD3S
 
+_INF = float("inf")
+
+# Occurrence distribution short name (e.g. "exp") -> class name cache
+_CLSNAME_CACHE = {}
+
+
+def get_occ_dist_clsname(dist):
+    clsname = _CLSNAME_CACHE.get(dist)
+    if clsname is None:
+        clsname = _CLSNAME_CACHE[dist] = dist.capitalize() + "OccDistribution"
+    return clsname
+
 
 class StateModel(ObjCOD3S):
     name: str = pydantic.Field(..., description="State name")
@@ -17,11 +31,14 @@ class PycState(StateModel):
 
     @classmethod
     def from_bkd(basecls, bkd):
-        state = basecls(
-            id=bkd.name(),
-            name=bkd.basename(),
-            comp_name=bkd.parent().name(),
-            aut_name=bkd.automaton().basename(),
+        # from_bkd methods build models with model_construct: backend data is
+        # trusted, so pydantic validation is skipped. Names are interned as
+        # they are used for lookups and comparisons.
+        state = basecls.model_construct(
+            id=sys.intern(bkd.name()),
+            name=sys.intern(bkd.basename()),
+            comp_name=sys.intern(bkd.parent().name()),
+            aut_name=sys.intern(bkd.automaton().basename()),
             is_active=bkd.isActive(),
             bkd=bkd,
         )
@@ -33,30 +50,25 @@ class PycState(StateModel):
 
 
 class OccurrenceDistributionModel(ObjCOD3S):
-    bkd: typing.Any = pydantic.Field(None, description="Backend handler")
+    bkd: typing.Any = pydantic.Field(
+        None, description="Backend handler", exclude=True, repr=False
+    )
 
     @staticmethod
     def get_clsname(**specs):
-        clsname = specs.pop("dist")
-        clsname = clsname.capitalize() + "OccDistribution"
+        return get_occ_dist_clsname(specs.pop("dist"))
 
-        return clsname
 
-    def model_dump(self, **kwrds):
-        exclude_list = [
-            "bkd",
-        ]
-        if kwrds.get("exclude"):
-            [kwrds["exclude"].add(attr) for attr in exclude_list]
-        else:
-            kwrds["exclude"] = set(exclude_list)
-
-        return super().model_dump(**kwrds)
+@dataclasses.dataclass(frozen=True, slots=True)
+class StateProbModel:
+    """INST transition target state with its probability.
 
+    Plain slotted dataclass: pydantic still validates it when used as a
+    model field, without the per-instance BaseModel overhead.
+    """
 
-class StateProbModel(pydantic.BaseModel):
-    state: str = pydantic.Field(..., description="State name")
-    prob: float = pydantic.Field(..., description="State probability")
+    state: str  # State name
+    prob: float  # State probability
 
 
 class TransitionModel(ObjCOD3S):
@@ -72,7 +84,9 @@ class TransitionModel(ObjCOD3S):
         None, description="Transition end time"
     )
     condition: typing.Any = pydantic.Field(None, description="Transition condition")
-    bkd: typing.Any = pydantic.Field(None, description="Backend handler")
+    bkd: typing.Any = pydantic.Field(
+        None, description="Backend handler", exclude=True, repr=False
+    )
 
     @staticmethod
     def sanitize_occ_law(occ_law_specs):
@@ -82,8 +96,7 @@ class TransitionModel(ObjCOD3S):
         if not (isinstance(occ_law_specs, OccurrenceDistributionModel)):
             clsname = occ_law_specs.get("cls")
             if clsname:
-                clsname = clsname.capitalize() + "OccDistribution"
-                occ_law_specs["cls"] = clsname
+                occ_law_specs["cls"] = get_occ_dist_clsname(clsname)
             else:
                 raise AttributeError(
                     "Missing attribute 'cls' in OccurrenceDistributionModel"
@@ -93,6 +106,31 @@ class TransitionModel(ObjCOD3S):
         else:
             return occ_law_specs
 
+    @staticmethod
+    def sanitize_target_probs(target):
+        """Complete or normalize INST target probabilities in place.
+
+        Targets without probability share the remaining probability mass
+        equally. If all targets have a probability, they are normalized.
+        """
+        probs_tot_tmp = 0
+        states_no_prob = []
+        for st in target:
+            if "prob" in st:
+                probs_tot_tmp += st["prob"]
+            else:
+                states_no_prob.append(st)
+
+        if states_no_prob:
+            probs_comp = (1 - probs_tot_tmp) / len(states_no_prob)
+            for st in states_no_prob:
+                st["prob"] = probs_comp
+        else:
+            for st in target:
+                st["prob"] /= probs_tot_tmp
+
+        return target
+
     @pydantic.model_validator(mode="before")
     def check_model(cls, values, **kwargs):
         target = values["target"]
@@ -102,15 +140,7 @@ class TransitionModel(ObjCOD3S):
                 values["occ_law"] = cls.sanitize_occ_law(values["occ_law"])
         else:
             # Case INST distribution
-            probs_tot_tmp = sum([st.get("prob", 0) for st in target])
-            states_no_prob = [st for st in target if "prob" not in st]
-            nb_states_no_prob = len(states_no_prob)
-            if nb_states_no_prob > 0:
-                probs_comp = (1 - probs_tot_tmp) / nb_states_no_prob
-                [st.setdefault("prob", probs_comp) for st in target]
-            else:
-                for st in target:
-                    st["prob"] /= probs_tot_tmp
+            cls.sanitize_target_probs(target)
 
         return values
 
@@ -152,6 +182,10 @@ class AutomatonModel(ObjCOD3S):
     )
     bkd: typing.Any = pydantic.Field(None, description="Backend handler")
 
+    # name -> position dicts built lazily by _get_by_name
+    _states_index: typing.Any = pydantic.PrivateAttr(None)
+    _transitions_index: typing.Any = pydantic.PrivateAttr(None)
+
     @pydantic.field_validator("states", mode="before")
     def check_states(cls, value, values, **kwargs):
         states_new = []
@@ -162,34 +196,39 @@ class AutomatonModel(ObjCOD3S):
 
     @pydantic.model_validator(mode="after")
     def check_consistency(cls, values):
-        states_name_list = [st.name for st in values.states]
         init_state = values.init_state
+        if not values.transitions and init_state is None:
+            # Nothing to check
+            return values
 
-        if (init_state is not None) and (init_state not in states_name_list):
+        # Ordered name set for membership tests, only listed on errors
+        state_names = dict.fromkeys(st.name for st in values.states)
+
+        if (init_state is not None) and (init_state not in state_names):
             raise ValueError(
-                f"Init state '{init_state}' not in automaton states list {states_name_list}"
+                f"Init state '{init_state}' not in automaton states list {list(state_names)}"
             )
 
         for trans in values.transitions:
             st_source = trans.source
-            if st_source not in states_name_list:
+            if st_source not in state_names:
                 raise ValueError(
-                    f"Transition '{trans.name}' source state '{st_source}' not in automaton states list {states_name_list}"
+                    f"Transition '{trans.name}' source state '{st_source}' not in automaton states list {list(state_names)}"
                 )
             st_target = trans.target
 
             if isinstance(st_target, str):
                 # transition is a timed transition
-                if st_target not in states_name_list:
+                if st_target not in state_names:
                     raise ValueError(
-                        f"Transition '{trans.name}' target state '{st_target}' not in automaton states list {states_name_list}"
+                        f"Transition '{trans.name}' target state '{st_target}' not in automaton states list {list(state_names)}"
                     )
             else:
                 # transition is an inst transition
                 for st in st_target:
-                    if st.state not in states_name_list:
+                    if st.state not in state_names:
                         raise ValueError(
-                            f"Transition '{trans.name}' (INST) target state '{st.state}' not in automaton states list {states_name_list}"
+                            f"Transition '{trans.name}' (INST) target state '{st.state}' not in automaton states list {list(state_names)}"
                         )
 
         # pw1, pw2 = values.get('password1'), values.get('password2')
@@ -197,12 +236,35 @@ class AutomatonModel(ObjCOD3S):
         #     raise ValueError('passwords do not match')
         return values
 
+    def _get_by_name(self, index_attr, elts, name):
+        """Return the element of elts named name, or None.
+
+        A cached position is only trusted if the element found there still
+        has this name. Otherwise, or for an unknown name, the name ->
+        position dict is rebuilt from elts so that in-place list edits and
+        renamings are taken into account. As in a linear scan, the first
+        element wins in case of duplicate names.
+        """
+        index = getattr(self, index_attr)
+        if index is not None:
+            pos = index.get(name)
+            if pos is not None and pos < len(elts) and elts[pos].name == name:
+                return elts[pos]
+
+        index = {}
+        for pos, elt in enumerate(elts):
+            index.setdefault(elt.name, pos)
+        setattr(self, index_attr, index)
+
+        pos = index.get(name)
+        return None if pos is None else elts[pos]
+
     def get_state_by_name(self, state_name):
-        for state in self.states:
-            if state.name == state_name:
-                return state
+        state = self._get_by_name("_states_index", self.states, state_name)
+        if state is None:
+            raise ValueError(f"State {state_name} is not part of automaton {self.name}")
 
-        raise ValueError(f"State {state_name} is not part of automaton {self.name}")
+        return state
 
     def get_active_state(self):
         active_state_name = self.bkd.currentState().basename()
@@ -211,37 +273,34 @@ class AutomatonModel(ObjCOD3S):
         return state
 
     def get_transition_by_name(self, name):
-        for elt in self.transitions:
-            if elt.name == name:
-                return elt
+        elt = self._get_by_name("_transitions_index", self.transitions, name)
+        if elt is None:
+            raise ValueError(f"Transition {name} is not part of automaton {self.name}")
 
-        raise ValueError(f"Transition {name} is not part of automaton {self.name}")
+        return elt
 
 
 class PycOccurrenceDistribution(OccurrenceDistributionModel):
     @classmethod
     def from_bkd(basecls, pyc_occ_law):
-        if pyc_occ_law.name() == "delay":
-            return DelayOccDistribution(time=pyc_occ_law.parameter(0), bkd=pyc_occ_law)
-        elif pyc_occ_law.name() == "exp":
-            return ExpOccDistribution(rate=pyc_occ_law.parameter(0), bkd=pyc_occ_law)
-        elif pyc_occ_law.name() == "inst":
-            if pyc_occ_law.nbParam() >= 1:
-                probs = [pyc_occ_law.parameter(i) for i in range(pyc_occ_law.nbParam())]
-            else:
-                probs = [1]
-            return InstOccDistribution(probs=probs, bkd=pyc_occ_law)
-        else:
+        cls = _DIST_DISPATCH.get(pyc_occ_law.name())
+        if cls is None:
             raise ValueError(
                 f"Pycatshoo distribution {pyc_occ_law.name()} is not supported by COD3S"
             )
 
+        return cls.from_bkd(pyc_occ_law)
+
 
 class DelayOccDistribution(PycOccurrenceDistribution):
     time: typing.Any = pydantic.Field(
         0, description="Delay duration (could be a variable)"
     )
 
+    @classmethod
+    def from_bkd(cls, pyc_occ_law):
+        return cls.model_construct(time=pyc_occ_law.parameter(0), bkd=pyc_occ_law)
+
     def to_bkd(self, comp_bkd):
         return pyc.IDistLaw.newLaw(comp_bkd, pyc.TLawType.defer, self.time)
 
@@ -254,6 +313,10 @@ class ExpOccDistribution(PycOccurrenceDistribution):
         0, description="Occurrence rate (could be a variable)"
     )
 
+    @classmethod
+    def from_bkd(cls, pyc_occ_law):
+        return cls.model_construct(rate=pyc_occ_law.parameter(0), bkd=pyc_occ_law)
+
     def to_bkd(self, comp_bkd):
         return pyc.IDistLaw.newLaw(comp_bkd, pyc.TLawType.expo, self.rate)
 
@@ -266,10 +329,19 @@ class InstOccDistribution(PycOccurrenceDistribution):
         [], description="Occurrence probabilité (could be a variable)"
     )
 
+    @classmethod
+    def from_bkd(cls, pyc_occ_law):
+        if pyc_occ_law.nbParam() >= 1:
+            probs = [pyc_occ_law.parameter(i) for i in range(pyc_occ_law.nbParam())]
+        else:
+            probs = [1]
+        return cls.model_construct(probs=probs, bkd=pyc_occ_law)
+
     def to_bkd(self, comp_bkd):
         law = pyc.IDistLaw.newLaw(comp_bkd, pyc.TLawType.inst, 1)
         if len(self.probs) >= 2:
-            [law.setParameter(pi, i) for i, pi in enumerate(self.probs[:-1])]
+            for i, pi in enumerate(self.probs[:-1]):
+                law.setParameter(pi, i)
         return law
 
     def __str__(self):
@@ -292,6 +364,14 @@ class UniformOccDistribution(PycOccurrenceDistribution):
         return f"unif({self.min}, {self.max})"
 
 
+# Pycatshoo distribution name -> COD3S occurrence distribution class
+_DIST_DISPATCH = {
+    "delay": DelayOccDistribution,
+    "exp": ExpOccDistribution,
+    "inst": InstOccDistribution,
+}
+
+
 class PycTransition(TransitionModel):
     comp_name: str = pydantic.Field(None, description="transition component name")
     comp_classname: str = pydantic.Field(
@@ -305,31 +385,45 @@ class PycTransition(TransitionModel):
 
     @classmethod
     def from_bkd(basecls, trans_bkd):
-        trans_name = trans_bkd.basename()
-        comp_name = trans_bkd.parent().name()
-        comp_classname = trans_bkd.parent().className()
+        # Backend calls are made once and kept in locals
+        comp_bkd = trans_bkd.parent()
+        trans_name = sys.intern(trans_bkd.basename())
+        comp_name = sys.intern(comp_bkd.name())
+        comp_classname = sys.intern(comp_bkd.className())
         is_interruptible = trans_bkd.interruptible()
-        end_time = trans_bkd.endTime() if trans_bkd.endTime() < float("inf") else None
+        end_time = trans_bkd.endTime()
+        if not end_time < _INF:
+            end_time = None
 
         state_source_bkd = trans_bkd.startState()
-        source = state_source_bkd.basename()
+        source = sys.intern(state_source_bkd.basename())
 
         occ_law = PycOccurrenceDistribution.from_bkd(trans_bkd.distLaw())
 
         if isinstance(occ_law, InstOccDistribution):
+            # No target count is exposed by the backend: walk targets until
+            # target(i) returns None, with bound methods kept in locals
+            get_target = trans_bkd.target
+            probs = occ_law.probs
+            nb_probs = len(probs)
             target = []
             i = 0
-            while tgt := trans_bkd.target(i):
-                tgt_spec = {"state": tgt.basename()}
-                if len(occ_law.probs) > i:
-                    tgt_spec.update({"prob": occ_law.probs[i]})
+            while tgt := get_target(i):
+                tgt_spec = {"state": sys.intern(tgt.basename())}
+                if i < nb_probs:
+                    tgt_spec["prob"] = float(probs[i])
                 target.append(tgt_spec)
                 i += 1
+            # Validation is skipped below: complete target probabilities here
+            target = [
+                StateProbModel(**tgt_spec)
+                for tgt_spec in basecls.sanitize_target_probs(target)
+            ]
         else:
             state_target_bkd = trans_bkd.target(0)
-            target = state_target_bkd.basename()
+            target = sys.intern(state_target_bkd.basename())
 
-        return basecls(
+        return basecls.model_construct(
             name=trans_name,
             comp_name=comp_name,
             comp_classname=comp_classname,
@@ -342,7 +436,9 @@ class PycTransition(TransitionModel):
         )
 
     def update_bkd(self, automaton):
-        state_source = automaton.get_state_by_name(self.source)
+        # State lookups go through the automaton name index
+        get_state_by_name = automaton.get_state_by_name
+        state_source = get_state_by_name(self.source)
         self.bkd = state_source.bkd.addTransition(self.name)
         self.bkd.setInterruptible(self.is_interruptible)
         if self.condition is not None:
@@ -350,33 +446,22 @@ class PycTransition(TransitionModel):
 
         if isinstance(self.target, str):
             # The transition is a timed transition
-            state_target = automaton.get_state_by_name(self.target)
+            state_target = get_state_by_name(self.target)
             self.bkd.addTarget(state_target.bkd)
             if self.occ_law is not None:
                 self.bkd.setDistLaw(self.occ_law.to_bkd(self.bkd.parent()))
         else:
             # The transition is an INST transition
             # NOT WORKING: PARAMETERS DOES NOT SEEMED TO BE ASSIGNED...
+            add_target = self.bkd.addTarget
             probs = []
             for st in self.target:
-                state_target = automaton.get_state_by_name(st.state)
-                self.bkd.addTarget(state_target.bkd)
+                add_target(get_state_by_name(st.state).bkd)
                 probs.append(st.prob)
 
             occ_law = InstOccDistribution(probs=probs)
             self.bkd.setDistLaw(occ_law.to_bkd(self.bkd.parent()))
 
-    def model_dump(self, **kwrds):
-        exclude_list = [
-            "bkd",
-        ]
-        if kwrds.get("exclude"):
-            [kwrds["exclude"].add(attr) for attr in exclude_list]
-        else:
-            kwrds["exclude"] = set(exclude_list)
-
-        return super().model_dump(**kwrds)
-
     def __eq__(self, other):
         return (self.comp_name == other.comp_name) and (self.name == other.name)
 
@@ -392,6 +477,10 @@ class PycTransition(TransitionModel):
     #     #selfd["occ_law"] = self.occ_law.str_short()
 
 
+# Validator reused by PycAutomaton to build transitions from specs
+_TRANSITION_ADAPTER = pydantic.TypeAdapter(PycTransition)
+
+
 class PycAutomaton(AutomatonModel):
     # @pydantic.validator('states', pre=True)
     # def check_states(cls, value, values, **kwargs):
@@ -403,7 +492,10 @@ class PycAutomaton(AutomatonModel):
 
     @pydantic.field_validator("transitions", mode="before")
     def check_transitions(cls, value, values, **kwargs):
-        value = [PycTransition(**v) for v in value]
+        value = [
+            _TRANSITION_ADAPTER.validate_python(v) if isinstance(v, dict) else v
+            for v in value
+        ]
         return value
 
     def set_init_state(self, state):
@@ -425,16 +517,17 @@ class PycAutomaton(AutomatonModel):
         else:
             self.bkd.setInitState(self.get_state_by_name(self.init_state).bkd)
 
-        [trans.update_bkd(automaton=self) for trans in self.transitions]
+        for trans in self.transitions:
+            trans.update_bkd(automaton=self)
 
     @classmethod
     def from_bkd(basecls, bkd):
-        aut = basecls(
-            id=bkd.name(),
-            name=bkd.basename(),
-            comp_name=bkd.parent().name(),
+        aut = basecls.model_construct(
+            id=sys.intern(bkd.name()),
+            name=sys.intern(bkd.basename()),
+            comp_name=sys.intern(bkd.parent().name()),
             states=[PycState.from_bkd(state) for state in bkd.states()],
-            init_state=bkd.initState().basename(),
+            init_state=sys.intern(bkd.initState().basename()),
             bkd=bkd,
         )
         # aut.states = [PycState.from_bkd(state)
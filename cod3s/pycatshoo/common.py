@@ -1,70 +1,92 @@
 import Pycatshoo as pyc
 import operator
-import re
+from functools import lru_cache
+
+
+# COD3S variable type -> (Python type, Pycatshoo type)
+_PYC_TYPE_MAP = {
+    "bool": (bool, pyc.TVarType.t_bool),
+    "int": (int, pyc.TVarType.t_integer),
+    "float": (float, pyc.TVarType.t_double),
+}
+
+# Pycatshoo simulation mode -> COD3S simulation mode name
+_PYC_SIMU_MODE_MAP = {
+    pyc.TSimuMode.sm_stopped: "stop",
+    pyc.TSimuMode.sm_standard: "standard",
+    pyc.TSimuMode.sm_interactive: "interactive",
+}
+
+# COD3S attribute type -> Pycatshoo component attribute list method name
+_PYC_ATTR_LIST_NAME_MAP = {
+    "VAR": "variables",
+    "ST": "states",
+    "AUT": "automata",
+}
 
 
 def get_pyc_type(var_type):
-    if var_type == "bool":
-        return (bool, pyc.TVarType.t_bool)
-    elif var_type == "int":
-        return (int, pyc.TVarType.t_integer)
-    elif var_type == "float":
-        return (float, pyc.TVarType.t_double)
-    else:
-        raise ValueError(f"Type {var_type} not supported by PyCATSHOO")
+    try:
+        return _PYC_TYPE_MAP[var_type]
+    except (KeyError, TypeError):
+        raise ValueError(f"Type {var_type} not supported by PyCATSHOO") from None
 
 
 def get_pyc_simu_mode(simu_mode):
-
-    if simu_mode == pyc.TSimuMode.sm_stopped:
-        return "stop"
-    elif simu_mode == pyc.TSimuMode.sm_standard:
-        return "standard"
-    elif simu_mode == pyc.TSimuMode.sm_interactive:
-        return "interactive"
-    else:
-        raise ValueError(f"Simu type {simu_mode} not supported for now")
+    try:
+        return _PYC_SIMU_MODE_MAP[simu_mode]
+    except (KeyError, TypeError):
+        raise ValueError(f"Simu type {simu_mode} not supported for now") from None
 
 
 def get_pyc_attr_list_name(attr_type):
-    if attr_type == "VAR":
-        return "variables"
-    elif attr_type == "ST":
-        return "states"
-    elif attr_type == "AUT":
-        return "automata"
-    else:
-        raise ValueError(f"{attr_type} not supported by PyCATSHOO")
+    try:
+        return _PYC_ATTR_LIST_NAME_MAP[attr_type]
+    except (KeyError, TypeError):
+        raise ValueError(f"{attr_type} not supported by PyCATSHOO") from None
 
 
 def parse_inequality(input_string, default_ope=">="):
 
+    # Numeric thresholds are returned as is, without going through the cache
+    input_type = type(input_string)
+    if input_type is float:
+        return input_string, default_ope
+    if input_type is int:
+        return float(input_string), default_ope
+
     if input_string is None:
         return None, None
 
+    # Float subclasses (e.g. numpy.float64)
     if isinstance(input_string, float):
         return input_string, default_ope
 
-    # Mapping from string operators to the respective functions in the operator module
-    # WARNING NOTE: Here key ordering matters for the following comparisons
-    operator_map = {
-        "<=": operator.le,
-        ">=": operator.ge,
-        "<": operator.lt,
-        ">": operator.gt,
-    }
+    return _parse_inequality(input_string)
+
 
-    # Iterate over the operators to find which one is in the input string
-    for op_str in operator_map:
-        if input_string.startswith(op_str):
-            # Extract the number part after the operator
-            try:
-                number = float(input_string[len(op_str) :].strip())
-                return number, operator_map[op_str]
-            except ValueError:
-                raise ValueError("Invalid number format in input string")
+# Inequalities come from a small set of configuration strings: cache results
+@lru_cache(maxsize=1024)
+def _parse_inequality(input_string):
 
-    raise ValueError("Invalid input format or unsupported operator")
+    # Operator is "<" or ">" optionally followed by "="
+    op_char = input_string[:1]
+    or_equal = input_string[1:2] == "="
+    if op_char == "<":
+        op_fun = operator.le if or_equal else operator.lt
+    elif op_char == ">":
+        op_fun = operator.ge if or_equal else operator.gt
+    else:
+        raise ValueError("Invalid input format or unsupported operator")
+
+    # Extract the number part after the operator
+    # (float() ignores surrounding whitespace)
+    try:
+        number = float(input_string[2 if or_equal else 1 :])
+    except ValueError:
+        raise ValueError("Invalid number format in input string")
+
+    return number, op_fun
 
 
 def compute_reference_mean(var_ref, default_value=0):
@@ -72,9 +94,12 @@ def compute_reference_mean(var_ref, default_value=0):
     total_value = var_ref.sumValue(default_value)
     # Get the number of connected values
     count = var_ref.cnctCount()
-    # Compute the mean
-    mean_value = total_value / count if count > 0 else total_value
-    return mean_value
+    # Compute the mean (no connection: the sum itself, i.e. divide by 1)
+    return total_value / (count or 1)
+
+
+# Quantile specification prefixes, e.g. "qle(0.1, 0.5)"
+_QUANTILE_PREFIXES = ("qle(", "qgt(")
 
 
 def parse_quantile(quantile_string, return_pct=False):
@@ -120,22 +145,42 @@ def parse_quantile(quantile_string, return_pct=False):
             ...
         ValueError: Invalid quantile string format. Expected 'qle(q1, q2, ..., qn)' or 'qgt(q1, q2, ..., qn)'
     """
-    match = re.search(r"q(?:le|gt)\((.*?)\)", quantile_string)
-
-    if not match:
-        raise ValueError(
-            "Invalid quantile string format. Expected 'qle(q1, q2, ..., qn)' or 'qgt(q1, q2, ..., qn)'"
-        )
-
-    content = match.group(1).strip()
-    if content:
-        quantiles = [float(q.strip()) for q in content.split(",")]
-        if return_pct:
-            quantiles = [q * 100 for q in quantiles]
-    else:
+    quantiles = _parse_quantile(quantile_string, return_pct)
+    # Cached result is a tuple: return a fresh list to the caller
+    return list(quantiles)
+
+
+@lru_cache(maxsize=256)
+def _parse_quantile(quantile_string, return_pct):
+    # Find the leftmost "qle(" or "qgt(" followed by a ")" with no newline in
+    # between (same match as re.search(r"q(?:le|gt)\((.*?)\)", ...))
+    pos = 0
+    while True:
+        start = -1
+        for prefix in _QUANTILE_PREFIXES:
+            idx = quantile_string.find(prefix, pos)
+            if idx >= 0 and (start < 0 or idx < start):
+                start = idx
+        end = quantile_string.find(")", start + 4) if start >= 0 else -1
+
+        if end < 0:
+            raise ValueError(
+                "Invalid quantile string format. Expected 'qle(q1, q2, ..., qn)' or 'qgt(q1, q2, ..., qn)'"
+            )
+
+        if quantile_string.find("\n", start + 4, end) < 0:
+            break
+        pos = start + 1
+
+    content = quantile_string[start + 4 : end].strip()
+    if not content:
         quantiles = []
+    elif return_pct:
+        quantiles = [float(q.strip()) * 100 for q in content.split(",")]
+    else:
+        quantiles = [float(q.strip()) for q in content.split(",")]
 
-    return quantiles
+    return tuple(quantiles)
 
 
 if __name__ == "__main__":
@@ -2,12 +2,17 @@
 
 import pydantic
 import typing
+import sys
 import pandas as pd
 from ..core import ObjCOD3S
-from .automaton import PycAutomaton, PycState
+from ..utils import iter_subclasses, get_subclass_index, clear_subclass_index
+from .automaton import PycAutomaton
 import Pycatshoo as pyc
 import copy
 
+# Immutable value types that can be shared between metadata copies
+_ATOMIC_TYPES = frozenset((str, int, float, bool, type(None)))
+
 
 class PycVariable(ObjCOD3S):
     id: str = pydantic.Field(..., description="Variable id")
@@ -19,10 +24,10 @@ class PycVariable(ObjCOD3S):
 
     @classmethod
     def from_bkd(basecls, bkd):
-        return basecls(
-            id=bkd.name(),
-            name=bkd.basename(),
-            comp_name=bkd.parent().name(),
+        return basecls.model_construct(
+            id=sys.intern(bkd.name()),
+            name=sys.intern(bkd.basename()),
+            comp_name=sys.intern(bkd.parent().name()),
             value_init=bkd.initValue(),
             value_current=bkd.value(),
             bkd=bkd,
@@ -30,7 +35,12 @@ class PycVariable(ObjCOD3S):
 
 
 class PycComponent(pyc.CComponent):
-    def __init__(self, name, label=None, description=None, metadata={}, **kwargs):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # New subclasses must show up in from_dict
+        clear_subclass_index()
+
+    def __init__(self, name, label=None, description=None, metadata=None, **kwargs):
         super().__init__(name)
 
         self.label = name if label is None else label
@@ -38,7 +48,13 @@ class PycComponent(pyc.CComponent):
 
         self.automata = {}
 
-        self.metadata = copy.deepcopy(metadata)
+        # Metadata are usually empty or flat: only deep copy nested values
+        if not metadata:
+            self.metadata = {}
+        elif all(type(value) in _ATOMIC_TYPES for value in metadata.values()):
+            self.metadata = dict(metadata)
+        else:
+            self.metadata = copy.deepcopy(metadata)
 
         # Register the component in comp dictionnary
         self.system().comp[name] = self
@@ -54,16 +70,13 @@ class PycComponent(pyc.CComponent):
         # Return value
         A list of subclasses of `cls`.
         """
-        sub = cls.__subclasses__()
         if recursive:
-            for cls in sub:
-                sub.extend(cls.get_subclasses(recursive))
-        return sub
+            return list(iter_subclasses(cls))
+        return cls.__subclasses__()
 
     @classmethod
     def from_dict(basecls, **specs):
-        cls_sub_dict = {cls.__name__: cls for cls in basecls.get_subclasses()}
-        cls_sub_dict[basecls.__name__] = basecls
+        cls_sub_dict = get_subclass_index(basecls)
 
         clsname = specs.pop("cls")
         cls = cls_sub_dict.get(clsname)
@@ -81,15 +94,33 @@ class PycComponent(pyc.CComponent):
         # comp.automata = \
         #     [PycAutomaton.from_bkd(elt) for elt in bkd.getAutomata()]
 
+        # Build the PycVariable/PycState dumps (without bkd) straight from
+        # the backend instead of going through the pydantic models
+        name = self.name()
         return {
-            "name": self.name(),
+            "name": name,
             "cls": self.className(),
             "variables": [
-                PycVariable.from_bkd(elt).dict(exclude={"bkd"})
+                {
+                    "cls": "PycVariable",
+                    "id": elt.name(),
+                    "name": elt.basename(),
+                    "comp_name": name,
+                    "value_init": elt.initValue(),
+                    "value_current": elt.value(),
+                }
                 for elt in self.variables()
             ],
             "states": [
-                PycState.from_bkd(elt).dict(exclude={"bkd"}) for elt in self.states()
+                {
+                    "cls": "PycState",
+                    "name": elt.basename(),
+                    "id": elt.name(),
+                    "comp_name": name,
+                    "aut_name": elt.automaton().basename(),
+                    "is_active": elt.isActive(),
+                }
+                for elt in self.states()
             ],
         }
 
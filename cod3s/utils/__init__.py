@@ -1 +1,2 @@
 from .etl import update_dict_deep, dict_diff
+from .classes import iter_subclasses, get_subclass_index, clear_subclass_index
@@ -0,0 +1,78 @@
+import collections
+import weakref
+
+
+def iter_subclasses(cls):
+    """
+    Iterate over all subclasses of a class, breadth-first.
+
+    Each subclass is yielded once, even if it is reachable through several
+    parents. Direct subclasses come first.
+
+    Args:
+        cls (type): The class to enumerate subclasses for.
+
+    Yields:
+        type: The subclasses of cls.
+
+    Examples:
+        >>> class A: pass
+        >>> class B(A): pass
+        >>> class C(B): pass
+        >>> class D(C, A): pass
+        >>> [sub.__name__ for sub in iter_subclasses(A)]
+        ['B', 'D', 'C']
+    """
+    seen = set()
+    queue = collections.deque([cls])
+    while queue:
+        for subcls in queue.popleft().__subclasses__():
+            if subcls not in seen:
+                seen.add(subcls)
+                queue.append(subcls)
+                yield subcls
+
+
+# Name -> class indexes by base class. Only weak references are kept so
+# that classes created on the fly can still be garbage collected.
+_SUBCLASS_INDEX_CACHE = weakref.WeakKeyDictionary()
+
+
+def get_subclass_index(basecls, root=None):
+    """
+    Return a name -> class mapping of the subclasses of root, plus basecls.
+
+    The mapping is cached by basecls until clear_subclass_index is called.
+    Class hierarchies using it must call clear_subclass_index whenever a
+    subclass is created, typically from __init_subclass__.
+
+    Args:
+        basecls (type): The class requesting the index, always part of it.
+        root (type, optional): The class whose subclasses are indexed.
+            Defaults to basecls.
+
+    Returns:
+        Mapping: Classes by name. If several classes share a name, basecls
+        wins, then the last subclass found.
+
+    Examples:
+        >>> class A: pass
+        >>> class B(A): pass
+        >>> sorted(get_subclass_index(A))
+        ['A', 'B']
+    """
+    index = _SUBCLASS_INDEX_CACHE.get(basecls)
+    if index is None:
+        index = weakref.WeakValueDictionary(
+            (cls.__name__, cls)
+            for cls in iter_subclasses(basecls if root is None else root)
+        )
+        index[basecls.__name__] = basecls
+        _SUBCLASS_INDEX_CACHE[basecls] = index
+
+    return index
+
+
+def clear_subclass_index():
+    """Drop all cached subclass indexes."""
+    _SUBCLASS_INDEX_CACHE.clear()
@@ -0,0 +1,156 @@
+import pytest
+from cod3s.pycatshoo.automaton import (
+    AutomatonModel,
+    StateModel,
+    TransitionModel,
+    PycAutomaton,
+    PycTransition,
+)
+
+
+class BkdStub:
+    """Minimal stand-in for Pycatshoo backend objects."""
+
+    def __init__(self, name, parent=None, **methods):
+        self._name = name
+        self._parent = parent
+        for method_name, value in methods.items():
+            setattr(self, method_name, (lambda value: lambda *args: value)(value))
+
+    def basename(self):
+        return self._name
+
+    def name(self):
+        if self._parent is None:
+            return self._name
+        return f"{self._parent.name()}.{self._name}"
+
+    def parent(self):
+        return self._parent if self._parent is not None else self
+
+
+def make_inst_transition_bkd(params, target_names):
+    comp = BkdStub("C", className="PycComponent")
+    aut = BkdStub("aut", parent=comp)
+    states = {
+        name: BkdStub(name, parent=comp, automaton=aut)
+        for name in ["s0"] + target_names
+    }
+    law = BkdStub("inst", nbParam=len(params))
+    law.parameter = lambda i: params[i]
+    targets = [states[name] for name in target_names]
+    trans = BkdStub(
+        "t",
+        parent=comp,
+        interruptible=True,
+        endTime=float("inf"),
+        startState=states["s0"],
+        distLaw=law,
+    )
+    trans.target = lambda i: targets[i] if i < len(targets) else None
+    return trans
+
+
+@pytest.fixture
+def automaton():
+    return AutomatonModel(name="aut", states=["s1", "s2", "s3"], init_state="s1")
+
+
+def test_get_state_by_name(automaton):
+    assert automaton.get_state_by_name("s1") is automaton.states[0]
+    assert automaton.get_state_by_name("s3") is automaton.states[2]
+
+    with pytest.raises(ValueError):
+        automaton.get_state_by_name("s9")
+
+
+def test_get_state_by_name_inplace_replace(automaton):
+    # Build the name index
+    automaton.get_state_by_name("s1")
+
+    automaton.states[0] = StateModel(name="s9")
+
+    assert automaton.get_state_by_name("s9") is automaton.states[0]
+    with pytest.raises(ValueError):
+        automaton.get_state_by_name("s1")
+
+
+def test_get_state_by_name_rename(automaton):
+    # Build the name index
+    automaton.get_state_by_name("s2")
+
+    automaton.states[1].name = "s4"
+
+    assert automaton.get_state_by_name("s4") is automaton.states[1]
+    with pytest.raises(ValueError):
+        automaton.get_state_by_name("s2")
+
+
+def test_get_state_by_name_list_append(automaton):
+    # Build the name index
+    automaton.get_state_by_name("s1")
+
+    automaton.states.append(StateModel(name="s5"))
+
+    assert automaton.get_state_by_name("s5") is automaton.states[3]
+
+
+def test_get_state_by_name_duplicate(automaton):
+    automaton.states.append(StateModel(name="s1"))
+
+    assert automaton.get_state_by_name("s1") is automaton.states[0]
+
+
+def test_sanitize_target_probs_complete():
+    target = [{"state": "s1", "prob": 0.4}, {"state": "s2"}, {"state": "s3"}]
+    TransitionModel.sanitize_target_probs(target)
+
+    assert [st["prob"] for st in target] == pytest.approx([0.4, 0.3, 0.3])
+
+
+def test_sanitize_target_probs_normalize():
+    target = [{"state": "s1", "prob": 1}, {"state": "s2", "prob": 3}]
+    TransitionModel.sanitize_target_probs(target)
+
+    assert [st["prob"] for st in target] == pytest.approx([0.25, 0.75])
+
+
+def test_pyc_transition_from_bkd_inst_complement():
+    trans_bkd = make_inst_transition_bkd([0.25, 0.5], ["s1", "s2", "s3"])
+    trans = PycTransition.from_bkd(trans_bkd)
+
+    assert [st.state for st in trans.target] == ["s1", "s2", "s3"]
+    assert [st.prob for st in trans.target] == pytest.approx([0.25, 0.5, 0.25])
+    assert trans.end_time is None
+
+
+def test_pyc_transition_from_bkd_inst_float_probs():
+    # No law parameter: the single target gets the whole probability
+    trans_bkd = make_inst_transition_bkd([], ["s1"])
+    trans = PycTransition.from_bkd(trans_bkd)
+
+    assert trans.model_dump()["target"] == [{"state": "s1", "prob": 1.0}]
+    assert type(trans.target[0].prob) is float
+
+    trans_bkd = make_inst_transition_bkd([1, 0], ["s1", "s2"])
+    trans = PycTransition.from_bkd(trans_bkd)
+
+    assert [type(st.prob) for st in trans.target] == [float, float]
+
+
+def test_pyc_automaton_from_bkd_get_state_by_name():
+    comp = BkdStub("C")
+    aut_bkd = BkdStub("aut", parent=comp)
+    states = [
+        BkdStub(name, parent=comp, automaton=aut_bkd, isActive=(name == "ok"))
+        for name in ["ok", "nok"]
+    ]
+    aut_bkd.states = lambda: states
+    aut_bkd.initState = lambda: states[0]
+
+    aut = PycAutomaton.from_bkd(aut_bkd)
+
+    assert aut.get_state_by_name("nok").bkd is states[1]
+    assert aut.get_state_by_name("ok").is_active
+    with pytest.raises(ValueError):
+        aut.get_state_by_name("unknown")
@@ -0,0 +1,91 @@
+import operator
+import pytest
+from cod3s.pycatshoo.common import (
+    compute_reference_mean,
+    parse_inequality,
+    parse_quantile,
+)
+
+
+class RefStub:
+    """Minimal Pycatshoo reference: connected values and their sum."""
+
+    def __init__(self, values):
+        self.values = values
+
+    def sumValue(self, default_value):
+        return float(sum(self.values)) if self.values else float(default_value)
+
+    def cnctCount(self):
+        return len(self.values)
+
+
+def test_compute_reference_mean_connected():
+    assert compute_reference_mean(RefStub([1.0, 2.0, 6.0])) == 3.0
+
+
+def test_compute_reference_mean_no_connection():
+    # No connection: the mean is the total value itself
+    assert compute_reference_mean(RefStub([])) == 0.0
+    assert compute_reference_mean(RefStub([]), default_value=2) == 2.0
+
+
+def test_parse_inequality_numeric():
+    assert parse_inequality(2.5) == (2.5, ">=")
+    assert parse_inequality(3, default_ope="<") == (3.0, "<")
+    assert type(parse_inequality(3)[0]) is float
+    assert parse_inequality(None) == (None, None)
+
+
+@pytest.mark.parametrize(
+    "input_string, number, op_fun",
+    [
+        ("<=3", 3.0, operator.le),
+        ("<2.5", 2.5, operator.lt),
+        (">= 1e-3", 1e-3, operator.ge),
+        (">-4", -4.0, operator.gt),
+    ],
+)
+def test_parse_inequality_operators(input_string, number, op_fun):
+    assert parse_inequality(input_string) == (number, op_fun)
+
+
+@pytest.mark.parametrize("input_string", ["=3", "3", "", "!=3"])
+def test_parse_inequality_bad_operator(input_string):
+    with pytest.raises(ValueError, match="unsupported operator"):
+        parse_inequality(input_string)
+
+
+@pytest.mark.parametrize("input_string", [">=x", "<", "<=1,5"])
+def test_parse_inequality_bad_number(input_string):
+    with pytest.raises(ValueError, match="Invalid number format"):
+        parse_inequality(input_string)
+
+
+def test_parse_quantile():
+    assert parse_quantile("qle(0.1, 0.5, 0.9)") == [0.1, 0.5, 0.9]
+    assert parse_quantile("qgt(0.25, 0.75)", return_pct=True) == [25.0, 75.0]
+    assert parse_quantile("qgt()") == []
+
+
+def test_parse_quantile_not_shared():
+    quantiles = parse_quantile("qle(0.1, 0.5)")
+    quantiles.append(1.0)
+
+    assert parse_quantile("qle(0.1, 0.5)") == [0.1, 0.5]
+    assert parse_quantile("qle(0.1, 0.5)") is not parse_quantile("qle(0.1, 0.5)")
+
+
+def test_parse_quantile_newline():
+    # Content never spans a newline: the next candidate is used instead
+    assert parse_quantile("qle(t\nqgt()0.1") == []
+    assert parse_quantile("qgt(\nqle(0.5)") == [0.5]
+    with pytest.raises(ValueError, match="Invalid quantile string format"):
+        parse_quantile("qgt(\n5,)")
+
+
+@pytest.mark.parametrize("quantile_string", ["qle(0.1", "q(0.1)", "qgt(a, b)"])
+def test_parse_quantile_invalid(quantile_string):
+    with pytest.raises(ValueError):
+        parse_quantile(quantile_string)
+